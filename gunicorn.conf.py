@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Gunicorn config — gevent workers serving main:app
+The master preloads the app, forks the single news producer and hands the
+shared-memory channel (and its lock) to every forked worker.
+"""
+
+import os
+import multiprocessing
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+worker_class = "gevent"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = int(os.getenv("WORKER_CONNECTIONS", "1000"))
+preload_app = True  # Import main once in the master so workers inherit SHM_LOCK
+PRODUCER_STOP_TIMEOUT = 10
+
+# Producer state lives in the preloaded main module, not here: SIGHUP re-executes this file
+
+def when_ready(server):
+    import main
+    if main.news_pid is None:
+        main.start_detached_news_process()
+
+def on_exit(server):
+    import main
+    main.stop_detached_news_process(PRODUCER_STOP_TIMEOUT)
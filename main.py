@@ -11,40 +11,110 @@ Features:
 - Flask API endpoints for Flutter frontend
 """
 
+# Patch blocking I/O before anything else imports socket/ssl/threading — only when run
+# directly. gunicorn preloads this module in its master, where patching breaks SIGCHLD
+# reaping of workers; its gevent workers patch themselves after fork.
+if __name__ == "__main__":
+    from gevent import monkey
+    monkey.patch_all()
+
 import os
+import re
+import sys
+import logging
+import json
+import struct
+import secrets
+import hashlib
 import time
 import signal
+import shutil
+import subprocess
 import requests
-import feedparser
 import threading
 import webbrowser
-from collections import deque
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, FrozenSet, List, Optional, Pattern, Sequence, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 from dotenv import load_dotenv
 
+# Rust-backed feed parser when available (same API as feedparser)
+try:
+    import feedparser_rs as feedparser
+except ImportError:
+    import feedparser
+
+# Optional fast JSON encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional multi-literal matchers for keyword/city prefiltering (Hyperscan preferred)
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional JSON log formatter for non-interactive (server) runs
+try:
+    from pythonjsonlogger.json import JsonFormatter
+except ImportError:
+    try:
+        from pythonjsonlogger.jsonlogger import JsonFormatter
+    except ImportError:
+        JsonFormatter = None
+
 # Optional sound
+try:
+    import winsound
+except ImportError:
+    winsound = None
 try:
     from playsound import playsound
 except Exception:
     playsound = None
 
 # -------------------- Flask imports --------------------
-from flask import Flask, jsonify, request  # For API server
+from flask import Flask, Response, jsonify, request  # For API server
 from flask_cors import CORS  # To allow Flutter app requests
 
 # -------------------- Load env --------------------
 load_dotenv()
 console = Console()
+INTERACTIVE = sys.stdout.isatty()  # Rich panels only when a human is watching
+
+def build_logger() -> logging.Logger:
+    log = logging.getLogger("news")
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        fmt = "%(asctime)s %(levelname)s %(message)s"
+        handler.setFormatter(JsonFormatter(fmt) if JsonFormatter else logging.Formatter(fmt))
+        log.addHandler(handler)
+        log.setLevel(logging.INFO)
+        log.propagate = False
+    return log
+
+logger = build_logger()
 
 # -------------------- Config --------------------
 RSS_URL = os.getenv("RSS_URL", "https://news.google.com/rss?hl=en-IN&gl=IN&ceid=IN:en")
 USER_CITY = os.getenv("USER_CITY", "Delhi").strip()
 REFRESH_INTERVAL = int(os.getenv("REFRESH_INTERVAL", "180"))
+MAX_ITEMS_PER_CYCLE = int(os.getenv("MAX_ITEMS_PER_CYCLE", "40"))
+RSS_TIMEOUT = int(os.getenv("RSS_TIMEOUT", "15"))
 SHOW_EVERY_CYCLE_SUMMARY = os.getenv("SHOW_EVERY_CYCLE_SUMMARY", "1") == "1"
 
 HF_ENABLE = os.getenv("HF_ENABLE", "1") == "1"
@@ -53,10 +123,13 @@ HF_API_URL = os.getenv("HF_API_URL", "https://api-inference.huggingface.co/model
 HF_SCORE_THRESHOLD = float(os.getenv("HF_SCORE_THRESHOLD", "0.50"))
 HF_TIMEOUT = int(os.getenv("HF_TIMEOUT", "12"))
 HF_MAX_PER_CYCLE = int(os.getenv("HF_MAX_PER_CYCLE", "20"))
+HF_MIN_TITLE_LEN = int(os.getenv("HF_MIN_TITLE_LEN", "40"))
 
 SOUND_FILE = os.getenv("SOUND_FILE", "").strip()
 SOUND_ENABLE = os.getenv("SOUND_ENABLE", "1") == "1"
 SEEN_CAPACITY = int(os.getenv("SEEN_CAPACITY", "1000"))
+SHM_PREFIX = os.getenv("SHM_PREFIX", "news_shm")
+SHM_SIZE = int(os.getenv("SHM_SIZE", "4000000"))
 
 CITY_SYNONYMS: Dict[str, List[str]] = {
     "delhi": ["delhi", "new delhi", "ndl", "ncr", "दिल्ली", "नई दिल्ली", "dilli"],
@@ -72,10 +145,30 @@ IMPORTANT_KEYWORDS = [
     "curfew", "evacuation", "collapse", "outbreak", "disease", "pandemic"
 ]
 
+# Soft signals: not decisive on their own, but worth an HF opinion
+SOFT_SIGNAL_WORDS = frozenset([
+    "alert", "warning", "emergency", "crisis", "dead", "death", "deaths", "died",
+    "injured", "toll", "victims", "rescue", "crash", "clash", "clashes", "strike",
+    "missile", "army", "police", "arrest", "arrested", "tension", "quake", "blaze",
+    "cyclone", "rain", "heatwave", "protest", "unrest", "virus", "cases"
+])
+
+# -------------------- HTTP session --------------------
+# Shared keep-alive pool for RSS + HF requests
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.3)))
+SESSION.headers["Accept-Encoding"] = "gzip, deflate"
+
 # -------------------- Utilities --------------------
 
+_now_cache: Tuple[int, str] = (-1, "")  # (epoch second, formatted string)
+
 def now_str() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")  # Current timestamp string
+    global _now_cache
+    sec = int(time.time())
+    if sec != _now_cache[0]:  # Only re-format when the second rolls over
+        _now_cache = (sec, datetime.fromtimestamp(sec).strftime("%Y-%m-%d %H:%M:%S"))
+    return _now_cache[1]  # Current timestamp string
 
 def normalize_text(s: str) -> str:
     return (s or "").strip().lower()  # lowercase + trim
@@ -84,43 +177,143 @@ def city_aliases(city: str) -> List[str]:
     c = normalize_text(city)
     return CITY_SYNONYMS.get(c, [c])
 
-def title_matches_city(title: str, city: str) -> bool:
-    t = normalize_text(title)
-    return any(alias in t for alias in city_aliases(city))
+def build_matcher() -> Optional[Callable[[str], set]]:
+    """Compile keywords and all known city aliases into one scanner (None if unavailable)"""
+    tags: Dict[str, set] = {}
+    for k in IMPORTANT_KEYWORDS:
+        tags.setdefault(normalize_text(k), set()).add("kw")
+    for city, aliases in CITY_SYNONYMS.items():
+        for alias in aliases:
+            tags.setdefault(normalize_text(alias), set()).add(("city", city))
+    words = list(tags)
+    word_tags: List[FrozenSet] = [frozenset(tags[w]) for w in words]
+
+    if hyperscan is not None:
+        db = hyperscan.Database()
+        flag = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        db.compile(expressions=[re.escape(w).encode("utf-8") for w in words],
+                   ids=list(range(len(words))), flags=[flag] * len(words))
+        def hs_scan(t: str) -> set:
+            hits = set()
+            def on_match(match_id, start, end, flags, context):
+                hits.update(word_tags[match_id])
+            db.scan(t.encode("utf-8"), match_event_handler=on_match)
+            return hits
+        return hs_scan
+
+    if ahocorasick is not None:
+        ac = ahocorasick.Automaton()
+        for word, wt in zip(words, word_tags):
+            ac.add_word(word, wt)
+        ac.make_automaton()
+        def ac_scan(t: str) -> set:
+            hits = set()
+            for _, wt in ac.iter(t):
+                hits |= wt
+            return hits
+        return ac_scan
+
+    return None
+
+MATCHER = build_matcher()
+
+def needs_hf(t: str) -> bool:
+    """Only ambiguous titles (long enough, with a soft signal word) go to HF; expects normalized text"""
+    return len(t) > HF_MIN_TITLE_LEN and not SOFT_SIGNAL_WORDS.isdisjoint(re.findall(r"\w+", t))
+
+def compile_literals(words: Sequence[str]) -> Pattern[str]:
+    """One alternation regex over already-normalized literal words"""
+    return re.compile("|".join(re.escape(normalize_text(w)) for w in words))
+
+KEYWORD_PATTERN = compile_literals(IMPORTANT_KEYWORDS)
 
-def keyword_prefilter(title: str, keywords: List[str]) -> bool:
-    t = normalize_text(title)
-    return any(k in t for k in keywords)
+def rule_match(t: str, c: str, city_re: Optional[Pattern[str]] = None) -> Tuple[bool, bool]:
+    """Return (is_city, is_keyword) for a normalized title and city in a single pass where possible"""
+    if MATCHER is None or c not in CITY_SYNONYMS:
+        if city_re is None:
+            city_re = compile_literals(city_aliases(c))
+        return city_re.search(t) is not None, KEYWORD_PATTERN.search(t) is not None
+    hits = MATCHER(t)
+    return ("city", c) in hits, "kw" in hits
+
+def find_player() -> Optional[List[str]]:
+    """Command line of an OS-native player we can fire and forget"""
+    for cmd in (["afplay"], ["paplay"], ["aplay", "-q"]):
+        if shutil.which(cmd[0]):
+            return cmd
+    return None
+
+SOUND_PLAYER = find_player()
 
 def sound_notify() -> None:
+    """Start the notification sound without waiting for it to finish"""
     if not SOUND_ENABLE:
         return
     try:
-        if playsound and SOUND_FILE and os.path.exists(SOUND_FILE):
-            playsound(SOUND_FILE)
+        has_file = bool(SOUND_FILE) and os.path.exists(SOUND_FILE)
+        if has_file and winsound:
+            winsound.PlaySound(SOUND_FILE, winsound.SND_FILENAME | winsound.SND_ASYNC)
+        elif has_file and SOUND_PLAYER:
+            subprocess.Popen(SOUND_PLAYER + [SOUND_FILE], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elif has_file and playsound:
+            threading.Thread(target=playsound, args=(SOUND_FILE,), daemon=True).start()
         else:
             console.print("\a", end="")  # fallback beep
     except Exception as e:
         console.print(f"[red]❌ Sound error:[/red] {e}")
 
-def hf_classify(text: str) -> Tuple[Optional[str], float]:
-    if not HF_ENABLE or not HF_API_KEY:
-        return None, 0.0
+def hf_classify_batch(texts: List[str]) -> List[Tuple[Optional[str], float]]:
+    """Classify several titles with a single HF inference request"""
+    results: List[Tuple[Optional[str], float]] = [(None, 0.0)] * len(texts)
+    if not texts or not HF_ENABLE or not HF_API_KEY:
+        return results
     try:
         headers = {"Authorization": f"Bearer {HF_API_KEY}"}
-        payload = {"inputs": text, "parameters": {"candidate_labels": IMPORTANT_KEYWORDS}}
-        resp = requests.post(HF_API_URL, headers=headers, json=payload, timeout=HF_TIMEOUT)
+        payload = {"inputs": texts, "parameters": {"candidate_labels": IMPORTANT_KEYWORDS}}
+        resp = SESSION.post(HF_API_URL, headers=headers, json=payload, timeout=HF_TIMEOUT)
         data = resp.json()
-        if "labels" in data and "scores" in data:
-            return data["labels"][0], float(data["scores"][0])
-        return None, 0.0
+        if isinstance(data, dict):
+            data = [data]  # single input may come back unwrapped
+        for i, entry in enumerate(data[:len(texts)]):
+            if isinstance(entry, dict) and entry.get("labels") and entry.get("scores"):
+                results[i] = (entry["labels"][0], float(entry["scores"][0]))
+        return results
     except Exception:
-        return None, 0.0
+        return results
+
+class NewsItem:
+    __slots__ = ("title", "link", "category", "score", "time", "is_important")
+    def __init__(self, title: str, link: str, category: str = "general", score: float = 0.0,
+                 time: str = "", is_important: bool = False):
+        self.title = title
+        self.link = link
+        self.category = category
+        self.score = score
+        self.time = time
+        self.is_important = is_important
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+# Conditional GET validators from the last successful fetch
+_rss_etag: Optional[str] = None
+_rss_modified: Optional[str] = None
 
-def fetch_rss(url: str) -> List[Dict[str, Any]]:
+def fetch_rss(url: str) -> List[NewsItem]:
+    global _rss_etag, _rss_modified
     try:
-        feed = feedparser.parse(url)
-        items = [{"title": e.title, "link": e.link} for e in getattr(feed, "entries", [])]
+        headers = {}
+        if _rss_etag:
+            headers["If-None-Match"] = _rss_etag
+        if _rss_modified:
+            headers["If-Modified-Since"] = _rss_modified
+        resp = SESSION.get(url, headers=headers, timeout=RSS_TIMEOUT)
+        if resp.status_code == 304:
+            return []  # Feed unchanged since last poll, skip parsing
+        resp.raise_for_status()
+        _rss_etag = resp.headers.get("ETag") or _rss_etag
+        _rss_modified = resp.headers.get("Last-Modified") or _rss_modified
+        feed = feedparser.parse(resp.content)
+        items = [NewsItem(getattr(e, "title", ""), getattr(e, "link", "")) for e in getattr(feed, "entries", [])]
         return items
     except Exception as e:
         console.print(f"[red]RSS fetch error:[/red] {e}")
@@ -129,30 +322,136 @@ def fetch_rss(url: str) -> List[Dict[str, Any]]:
 class BoundedDedup:
     def __init__(self, capacity: int = 1000):
         self.capacity = capacity
-        self.queue = deque(maxlen=capacity)
-        self.set = set()
+        self.entries: "OrderedDict[int, None]" = OrderedDict()  # LRU of title hashes
     def seen(self, key: str) -> bool:
-        k = key.strip()
-        if k in self.set:
+        k = hash(key.strip())
+        if k in self.entries:
+            self.entries.move_to_end(k)
             return True
-        self.queue.append(k)
-        self.set.add(k)
-        while len(self.set) > len(self.queue):
-            for s in list(self.set):
-                if s not in self.queue:
-                    self.set.remove(s)
-                    break
-            else:
-                break
+        self.entries[k] = None
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)  # evict least recently seen
         return False
 
+# -------------------- Shared memory channel --------------------
+# Layout: header | city slot | news JSON | important JSON
+SHM_HEADER = struct.Struct("<QHII")  # generation, city_len, news_len, important_len
+CITY_SLOT = 256
+SHM_DATA = SHM_HEADER.size + CITY_SLOT
+SHM_LOCK = multiprocessing.Lock()  # Created before any fork so every process shares it
+
+def json_default(obj: Any) -> Any:
+    if isinstance(obj, NewsItem):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def encode_json(payload: Dict[str, Any]) -> bytes:
+    if orjson:
+        return orjson.dumps(payload, default=json_default)
+    return json.dumps(payload, ensure_ascii=False, default=json_default).encode("utf-8")
+
+def with_etag(body: bytes) -> Tuple[bytes, str]:
+    return body, hashlib.blake2b(body, digest_size=8).hexdigest()
+
+def attach_shm(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name, track=False)  # Python 3.13+: don't unlink when a reader exits
+    except TypeError:
+        return SharedMemory(name)
+
+class NewsChannel:
+    """Shared-memory mailbox between the news process and API workers"""
+    def __init__(self, shm: SharedMemory, lock):
+        self.shm = shm
+        self.lock = lock
+        self._generation = -1
+        self._cached: Tuple[Tuple[bytes, str], Tuple[bytes, str]] = ((b"", ""), (b"", ""))
+
+    @classmethod
+    def create(cls, city: str, lock=SHM_LOCK) -> "NewsChannel":
+        # Unique per instance; fails loudly (FileExistsError) rather than touching a segment we didn't create
+        name = f"{SHM_PREFIX}_{os.getpid()}_{secrets.token_hex(4)}"
+        shm = SharedMemory(name, create=True, size=SHM_SIZE)
+        channel = cls(shm, lock)
+        channel.set_city(city)
+        channel.publish(encode_json({"news": []}), encode_json({"important": []}))
+        return channel
+
+    def __getstate__(self):
+        return {"name": self.shm.name, "lock": self.lock}
+
+    def __setstate__(self, state):
+        self.__init__(attach_shm(state["name"]), state["lock"])
+
+    def set_city(self, city: str) -> None:
+        raw = city.encode("utf-8")
+        if len(raw) > CITY_SLOT:
+            raise ValueError(f"City name exceeds {CITY_SLOT} bytes")
+        with self.lock:
+            generation, _, news_len, imp_len = SHM_HEADER.unpack_from(self.shm.buf, 0)
+            self.shm.buf[SHM_HEADER.size:SHM_HEADER.size + len(raw)] = raw
+            SHM_HEADER.pack_into(self.shm.buf, 0, generation, len(raw), news_len, imp_len)
+
+    def get_city(self) -> str:
+        with self.lock:
+            _, city_len, _, _ = SHM_HEADER.unpack_from(self.shm.buf, 0)
+            raw = bytes(self.shm.buf[SHM_HEADER.size:SHM_HEADER.size + city_len])
+        return raw.decode("utf-8", "ignore")
+
+    def publish(self, news_body: bytes, important_body: bytes) -> bool:
+        if SHM_DATA + len(news_body) + len(important_body) > self.shm.size:
+            return False
+        with self.lock:
+            generation, city_len, _, _ = SHM_HEADER.unpack_from(self.shm.buf, 0)
+            end = SHM_DATA + len(news_body)
+            self.shm.buf[SHM_DATA:end] = news_body
+            self.shm.buf[end:end + len(important_body)] = important_body
+            SHM_HEADER.pack_into(self.shm.buf, 0, generation + 1, city_len, len(news_body), len(important_body))
+        return True
+
+    def snapshot(self) -> Tuple[Tuple[bytes, str], Tuple[bytes, str]]:
+        """Return ((news, etag), (important, etag)), re-reading only when a new cycle landed"""
+        with self.lock:
+            generation, _, news_len, imp_len = SHM_HEADER.unpack_from(self.shm.buf, 0)
+            if generation == self._generation:
+                return self._cached
+            end = SHM_DATA + news_len
+            news_body = bytes(self.shm.buf[SHM_DATA:end])
+            important_body = bytes(self.shm.buf[end:end + imp_len])
+        self._cached = (with_etag(news_body), with_etag(important_body))
+        self._generation = generation
+        return self._cached
+
+    def close(self, unlink: bool = False) -> None:
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+channel: Optional[NewsChannel] = None
+
+def get_channel() -> Optional[NewsChannel]:
+    """Channel created by start_news_process (inherited by forked workers); None if there is no producer"""
+    return channel  # e.g. flask run or a test client
+
+# Served until a producer has published anything
+EMPTY_SNAPSHOT = (with_etag(encode_json({"news": []})), with_etag(encode_json({"important": []})))
+
+def news_snapshot() -> Tuple[Tuple[bytes, str], Tuple[bytes, str]]:
+    news_channel = get_channel()
+    return news_channel.snapshot() if news_channel else EMPTY_SNAPSHOT
+
 # -------------------- Flask API Setup --------------------
 app = Flask(__name__)  # Create Flask app
 CORS(app)  # Allow all origins (Flutter can call)
 
-# Global news cache
-latest_news = []
-important_news = []
+def cached_json(cached: Tuple[bytes, str]) -> Response:
+    body, etag = cached
+    if etag in request.if_none_match:
+        resp = Response(status=304)
+    else:
+        resp = Response(body, mimetype="application/json")
+    resp.set_etag(etag)
+    return resp
 
 @app.route("/")
 def root():
@@ -160,31 +459,41 @@ def root():
 
 @app.route("/news")
 def api_news():
-    return jsonify({"news": latest_news})  # Return latest news list
+    return cached_json(news_snapshot()[0])  # Return latest news list
 
 @app.route("/important")
 def api_important():
-    return jsonify({"important": important_news})  # Return filtered important news
+    return cached_json(news_snapshot()[1])  # Return filtered important news
 
 @app.route("/city", methods=["GET", "POST"])
 def api_city():
     global USER_CITY
+    news_channel = get_channel()
     if request.method == "POST":
-        data = request.json
-        if "city" in data:
-            USER_CITY = data["city"]
-            return jsonify({"status": "success", "city": USER_CITY})
+        data = request.get_json(silent=True)
+        city = data.get("city") if isinstance(data, dict) else None
+        if isinstance(city, str) and city.strip():
+            if len(city.encode("utf-8")) > CITY_SLOT:
+                return jsonify({"status": "error", "message": f"City name exceeds {CITY_SLOT} bytes"})
+            if news_channel:
+                news_channel.set_city(city)
+            else:
+                USER_CITY = city  # No producer to tell; keep it for this process
+            return jsonify({"status": "success", "city": city})
         return jsonify({"status": "error", "message": "City not provided"})
-    return jsonify({"city": USER_CITY})
+    return jsonify({"city": news_channel.get_city() if news_channel else USER_CITY})
 
 # -------------------- Main loop --------------------
-running = True
-def handle_sigint(signum, frame):
-    global running
-    running = False
-signal.signal(signal.SIGINT, handle_sigint)
+stop_event = threading.Event()  # Set on SIGINT/SIGTERM; wakes the news loop immediately
+def handle_stop(signum, frame):
+    stop_event.set()
+signal.signal(signal.SIGINT, handle_stop)
 
 def print_header():
+    if not INTERACTIVE:
+        logger.info("starting rss=%s city=%s refresh=%ss", RSS_URL, USER_CITY, REFRESH_INTERVAL,
+                    extra={"rss": RSS_URL, "city": USER_CITY, "refresh": REFRESH_INTERVAL})
+        return
     table = Table.grid(expand=True)
     table.add_column(justify="center")
     table.add_row(f"[bold cyan]🌍 Live Important News App[/bold cyan]")
@@ -192,73 +501,159 @@ def print_header():
     table.add_row(f"[dim]City:[/dim] {USER_CITY}  |  [dim]Refresh:[/dim] {REFRESH_INTERVAL}s")
     console.print(Panel.fit(table, border_style="cyan", box=box.ROUNDED))
 
-def update_news():
-    """Main news fetching loop"""
-    global latest_news, important_news
+def report_important(news: NewsItem) -> None:
+    sound_notify()
+    if not INTERACTIVE:
+        logger.info("important: %s | %s | category=%s score=%.2f", news.title, news.link, news.category, news.score,
+                    extra={"title": news.title, "link": news.link, "category": news.category, "score": news.score})
+        return
+    console.print(Panel.fit(
+        f"[bold yellow]{news.title}[/bold yellow]\n\n[blue]🔗 {news.link}[/blue]\n\n[green]🕒 {news.time}[/green]",
+        title="🔥 Important News",
+        subtitle=f"Category: {news.category} | Score: {news.score:.2f}",
+        border_style="red"
+    ))
+
+def update_news(news_channel: NewsChannel):
+    """Main news fetching loop; publishes each cycle into shared memory"""
+    # A forked producer inherits the parent's handlers (gunicorn's only queue the signal)
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
     dedup = BoundedDedup(SEEN_CAPACITY)
     cycle = 0
-    while running:
+    while not stop_event.is_set():
         cycle += 1
+        next_tick = time.monotonic() + REFRESH_INTERVAL  # Fixed cadence regardless of cycle cost
         items = fetch_rss(RSS_URL)
         if not items:
-            time.sleep(REFRESH_INTERVAL)
+            stop_event.wait(max(0.0, next_tick - time.monotonic()))
             continue
-        cycle_news = []
-        cycle_important = []
-        hf_budget = HF_MAX_PER_CYCLE
+        city = normalize_text(news_channel.get_city())
+        city_re = compile_literals(city_aliases(city))  # compiled once per cycle
+        cycle_news: List[NewsItem] = []
+        cycle_important: List[NewsItem] = []
+        pending: List[NewsItem] = []  # items awaiting HF
+        # Pass 1: cheap local rules, queue the rest for HF
         for news in items:
-            title = news.get("title", "")
-            link = news.get("link", "")
-            if not title or dedup.seen(title):
+            if len(cycle_news) >= MAX_ITEMS_PER_CYCLE:
+                break  # Bound per-cycle work; unseen leftovers are picked up next cycle
+            t_norm = normalize_text(news.title)  # normalized once, shared by every check below
+            if not t_norm or dedup.seen(t_norm):
                 continue
-            is_city = title_matches_city(title, USER_CITY)
-            is_keyword = keyword_prefilter(title, IMPORTANT_KEYWORDS)
-            label, score = None, 0.0
+            is_city, is_keyword = rule_match(t_norm, city, city_re)
             if is_city:
-                label, score = "city-priority", 1.0
+                news.category, news.score = "city-priority", 1.0
             elif is_keyword:
-                label, score = "keyword", 0.75
-            elif HF_ENABLE and HF_API_KEY and hf_budget > 0:
-                label, score = hf_classify(title)
-                hf_budget -= 1
-            news_item = {
-                "title": title,
-                "link": link,
-                "category": label or "general",
-                "score": float(score),
-                "time": now_str(),
-                "is_important": (label == "city-priority") or (score >= HF_SCORE_THRESHOLD) or (is_keyword and score >= 0.0)
-            }
-            cycle_news.append(news_item)
-            if news_item["is_important"]:
-                cycle_important.append(news_item)
-                sound_notify()
-                console.print(Panel.fit(
-                    f"[bold yellow]{title}[/bold yellow]\n\n[blue]🔗 {link}[/blue]\n\n[green]🕒 {now_str()}[/green]",
-                    title="🔥 Important News",
-                    subtitle=f"Category: {label or '—'} | Score: {score:.2f}",
-                    border_style="red"
-                ))
-        latest_news = cycle_news
-        important_news = cycle_important
+                news.category, news.score = "keyword", 0.75
+            elif HF_ENABLE and HF_API_KEY and len(pending) < HF_MAX_PER_CYCLE and needs_hf(t_norm):
+                pending.append(news)
+            news.time = now_str()
+            news.is_important = is_city or is_keyword
+            cycle_news.append(news)
+            if news.is_important:
+                cycle_important.append(news)
+                report_important(news)  # Rule hits notify right away, before any HF wait
+        # Pass 2: one batched HF request for everything still undecided
+        if pending:
+            results = hf_classify_batch([news.title for news in pending])
+            for news, (label, score) in zip(pending, results):
+                news.category = label or "general"
+                news.score = float(score)
+                news.is_important = score >= HF_SCORE_THRESHOLD
+                if news.is_important:
+                    cycle_important.append(news)
+                    report_important(news)
+        # Serialize once per cycle; API workers copy the bytes out as-is
+        if not news_channel.publish(encode_json({"news": cycle_news}), encode_json({"important": cycle_important})):
+            console.print(f"[red]Cycle {cycle} payload exceeds SHM_SIZE ({SHM_SIZE} bytes), not published[/red]")
         if SHOW_EVERY_CYCLE_SUMMARY:
-            console.print(f"[dim]{now_str()} — Cycle {cycle} complete. Important: {len(cycle_important)} | Total: {len(items)}[/dim]")
-        time.sleep(REFRESH_INTERVAL)
+            if INTERACTIVE:
+                console.print(f"[dim]{now_str()} — Cycle {cycle} complete. Important: {len(cycle_important)} | Total: {len(items)}[/dim]")
+            else:
+                logger.info("cycle %d complete important=%d total=%d", cycle, len(cycle_important), len(items),
+                            extra={"cycle": cycle, "important": len(cycle_important), "total": len(items)})
+        stop_event.wait(max(0.0, next_tick - time.monotonic()))
+
+def start_news_process() -> Tuple[NewsChannel, multiprocessing.Process]:
+    """Create the shared channel and start the single news producer"""
+    global channel
+    print_header()
+    channel = NewsChannel.create(USER_CITY)
+    # Run the news loop in its own process so it never contends with the API for the GIL
+    news_proc = multiprocessing.Process(target=update_news, args=(channel,), daemon=True)
+    news_proc.start()
+    return channel, news_proc
+
+# Producer forked for gunicorn; kept here because this module is preloaded once and
+# survives config reloads (SIGHUP re-runs gunicorn.conf.py, not this file)
+news_pid: Optional[int] = None
+
+def start_detached_news_process() -> int:
+    """Fork the producer outside multiprocessing's bookkeeping so forked workers never adopt it"""
+    global channel, news_pid
+    print_header()
+    channel = NewsChannel.create(USER_CITY)
+    pid = os.fork()
+    if pid == 0:
+        # Drop the arbiter's handlers; update_news installs its own for SIGTERM/SIGINT
+        for sig in (signal.SIGHUP, signal.SIGQUIT, signal.SIGCHLD, signal.SIGUSR1, signal.SIGUSR2,
+                    signal.SIGTTIN, signal.SIGTTOU, signal.SIGWINCH):
+            signal.signal(sig, signal.SIG_DFL)
+        code = 0
+        try:
+            update_news(channel)
+        except Exception:
+            logger.exception("news producer crashed")
+            code = 1
+        finally:
+            os._exit(code)  # Skip the master's atexit handlers
+    news_pid = pid
+    return pid
+
+def stop_detached_news_process(timeout: float = 10.0) -> None:
+    """SIGTERM the forked producer, SIGKILL it after timeout, then remove the segment"""
+    global news_pid
+    pid, news_pid = news_pid, None
+    if pid is not None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + timeout
+            while os.waitpid(pid, os.WNOHANG) == (0, 0):
+                if time.monotonic() >= deadline:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)
+                    break
+                time.sleep(0.1)
+        except (ProcessLookupError, ChildProcessError):
+            pass  # Already exited and reaped (gunicorn's SIGCHLD handler can get there first)
+    if channel is not None:
+        channel.close(unlink=True)
 
 # -------------------- Run both Flask + News loop --------------------
+# Production: `gunicorn main:app` (see gunicorn.conf.py, one producer for all workers)
 if __name__ == "__main__":
-    print_header()
-    # Start news loop in background thread
-    news_thread = threading.Thread(target=update_news, daemon=True)
-    news_thread.start()
+    channel, news_proc = start_news_process()
 
     # Detect Render/Heroku/Production (uses PORT from env)
     port = int(os.environ.get("PORT", 5000))
 
+    # Serve with gevent so API requests stay cooperative
+    import gevent
+    from gevent.pywsgi import WSGIServer
+    server = WSGIServer(("0.0.0.0", port), app)
+
+    def shutdown():
+        stop_event.set()
+        server.stop(timeout=5)  # serve_forever returns once in-flight requests finish
+
+    gevent.signal_handler(signal.SIGINT, shutdown)
+    gevent.signal_handler(signal.SIGTERM, shutdown)
     try:
-        # Use waitress in production
-        from waitress import serve
-        serve(app, host="0.0.0.0", port=port)
-    except ImportError:
-        # Fallback to Flask dev server (local run)
-        app.run(host="0.0.0.0", port=port)
+        server.serve_forever()
+    finally:
+        news_proc.terminate()  # No-op if the producer already stopped on the same SIGINT
+        news_proc.join(10)
+        if news_proc.is_alive():
+            news_proc.kill()
+            news_proc.join()
+        channel.close(unlink=True)